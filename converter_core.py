@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Universal Card Sharing Protocol Converter - shared conversion core
+Supports: CCcam, NewCamd, MGcamd, OSCam
+Version: 2.0
+Author: Alen Pepa
+LinkedIn: https://www.linkedin.com/in/alenpepa/
+Copyright © 2025 Alen Pepa. All rights reserved.
+"""
+
+import re
+from collections import namedtuple
+from datetime import datetime
+
+# Optional compiled parser: a Cython/C extension exporting
+# parse_buffer(text) -> sequence of Server-like records (objects with
+# protocol/hostname/port/username/password/des_key attributes, e.g. the
+# Server namedtuple below) can be dropped in as _parse_c for very large
+# batch conversions; the pure-Python batch parser below is the fallback.
+try:
+    from _parse_c import parse_buffer as _parse_buffer_c
+except ImportError:
+    _parse_buffer_c = None
+
+# Shared protocol table; built once at import instead of per instance.
+# params are tuples: immutable, constant-folded and cheaper to iterate
+PROTOCOLS = {
+    'cccam': {
+        'prefix': 'C:',
+        'default_port': 12000,
+        'params': ('hostname', 'port', 'username', 'password')
+    },
+    'newcamd': {
+        'prefix': 'N:',
+        'default_port': 15000,
+        'params': ('hostname', 'port', 'username', 'password', 'des_key')
+    },
+    'mgcamd': {
+        'prefix': 'M:',
+        'default_port': 15000,
+        'params': ('hostname', 'port', 'username', 'password')
+    }
+}
+
+# One C-level scan per line: prefix char plus up to five fields, extra
+# trailing text ignored. des_key is only meaningful for NewCamd.
+_LINE_RE = re.compile(r'^([CNM]):\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)(?:\s+(\S+))?')
+
+# Whole-buffer variant for the batch path: MULTILINE anchoring plus
+# [ \t] separators keep every match confined to a single line, so one
+# finditer pass replaces a Python-level loop of per-line match calls
+_BUFFER_RE = re.compile(
+    r'^[ \t]*([CNM]):[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)(?:[ \t]+(\S+))?',
+    re.MULTILINE)
+_PROTO_BY_CHAR = {'C': 'cccam', 'N': 'newcamd', 'M': 'mgcamd'}
+
+# Protocols that can be emitted as CCcam C-lines / NewCamd N-lines
+_CCCAM_COMPATIBLE = frozenset(('cccam', 'newcamd'))
+
+# DES key used when a CCcam server is rewritten as a NewCamd N-line
+_DEFAULT_DES_KEY = '0102030405060708091011121314'
+
+# Parsed server record; a namedtuple keeps it compact for large configs
+# and gives equality/repr for free
+Server = namedtuple('Server',
+                    ('protocol', 'hostname', 'port', 'username', 'password', 'des_key'),
+                    defaults=(None,))
+
+class UniversalCardSharingConverter:
+    _OSCAM_TPL_BASE = """[reader]
+label = {label}
+enable = 1
+protocol = {protocol}
+device = {hostname},{port}
+user = {username}
+password = {password}
+inactivitytimeout = 30
+reconnecttimeout = 30
+group = 1
+"""
+    _OSCAM_TPL_CCCAM = _OSCAM_TPL_BASE + "cccversion = 2.3.0\n\n"
+    _OSCAM_TPL_NEWCAMD = _OSCAM_TPL_BASE + "key = {des_key}\n\n"
+    _OSCAM_TPL_MGCAMD = _OSCAM_TPL_BASE + "\n"
+    _OSCAM_TEMPLATES = {
+        'cccam': _OSCAM_TPL_CCCAM,
+        'newcamd': _OSCAM_TPL_NEWCAMD,
+        'mgcamd': _OSCAM_TPL_MGCAMD
+    }
+    _NEWCAMD_LINE = "N: {hostname} {port} {username} {password} {des_key}\n"
+
+    protocols = PROTOCOLS
+
+    def __init__(self):
+        self.last_stream_count = 0
+
+    def parse_server_line(self, line):
+        """Parse server line and identify protocol"""
+        m = _LINE_RE.match(line.strip())
+        if m is None:
+            return None
+
+        proto_char, hostname, port, username, password, des_key = m.groups()
+        protocol = _PROTO_BY_CHAR[proto_char]
+        # des_key is only a real field for NewCamd; for the others the
+        # sixth capture is just trailing text
+        if protocol != 'newcamd':
+            des_key = None
+        elif des_key is None:
+            return None
+        return Server(protocol, hostname, port, username, password, des_key)
+
+    def _format_oscam(self, server, label):
+        """Fill the protocol's reader-block template for one server"""
+        return self._OSCAM_TEMPLATES[server.protocol].format(
+            label=label, protocol=server.protocol, hostname=server.hostname,
+            port=server.port, username=server.username,
+            password=server.password, des_key=server.des_key)
+
+    def _format_newcamd(self, server):
+        """Fill the N-line template, defaulting the DES key"""
+        return self._NEWCAMD_LINE.format(
+            hostname=server.hostname, port=server.port,
+            username=server.username, password=server.password,
+            des_key=server.des_key or _DEFAULT_DES_KEY)
+
+    def _make_header(self, title, count):
+        """Build the shared output file header"""
+        return (f"# {title}\n"
+                f"# Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+                f"# Total servers: {count}\n\n")
+
+    def _emit(self, header, pieces, out):
+        """Join pieces into a string, or write them to `out` if given"""
+        if out is None:
+            return header + ''.join(pieces)
+        out.write(header)
+        for piece in pieces:
+            out.write(piece)
+        return ''
+
+    def to_oscam_server(self, servers, out=None):
+        """Convert to OSCam server format; write to `out` when given"""
+        header = self._make_header("OSCam Server Configuration", len(servers))
+        # A list comprehension feeds join faster than a generator here:
+        # join can size the result in one pass over a materialized list
+        blocks = [self._format_oscam(server, f"{server.protocol}_{server.username}_{i+1}")
+                  for i, server in enumerate(servers)]
+        return self._emit(header, blocks, out)
+
+    def to_cccam_cfg(self, servers, out=None):
+        """Convert to CCcam.cfg format; write to `out` when given"""
+        header = self._make_header("CCcam Configuration", len(servers))
+        lines = (f"C: {server.hostname} {server.port} {server.username} {server.password}\n"
+                 for server in servers if server.protocol in _CCCAM_COMPATIBLE)
+        return self._emit(header, lines, out)
+
+    def to_newcamd_cfg(self, servers, out=None):
+        """Convert to NewCamd.cfg format; write to `out` when given"""
+        header = self._make_header("NewCamd Configuration", len(servers))
+        # CCcam servers are converted with the default DES key
+        lines = (self._format_newcamd(server)
+                 for server in servers if server.protocol in _CCCAM_COMPATIBLE)
+        return self._emit(header, lines, out)
+
+    def parse_buffer(self, text):
+        """Parse a whole text buffer into a list of Server records.
+
+        Uses the compiled _parse_c extension when available (it must
+        yield Server-like records, see the module comment); otherwise a
+        single MULTILINE regex pass over the whole buffer, which skips
+        blank/comment lines without any per-line Python work.
+        """
+        if _parse_buffer_c is not None:
+            return _parse_buffer_c(text)
+
+        servers = []
+        append = servers.append
+        for m in _BUFFER_RE.finditer(text):
+            proto_char, hostname, port, username, password, des_key = m.groups()
+            protocol = _PROTO_BY_CHAR[proto_char]
+            # Same des_key rules as parse_server_line
+            if protocol != 'newcamd':
+                des_key = None
+            elif des_key is None:
+                continue
+            append(Server(protocol, hostname, port, username, password, des_key))
+        return servers
+
+    def convert_text(self, text, output_format):
+        """Convert text directly; returns (output, converted server count)"""
+        servers = self.parse_buffer(text)
+
+        formatter = {
+            'oscam': self.to_oscam_server,
+            'cccam': self.to_cccam_cfg,
+            'newcamd': self.to_newcamd_cfg
+        }.get(output_format.lower())
+        if formatter is None:
+            return "", len(servers)
+
+        return formatter(servers), len(servers)
+
+    def convert_stream(self, lines, output_format):
+        """Convert an iterable of input lines, yielding output chunks.
+
+        The total server count is not known up front, so the header omits
+        it; the number of converted servers is available afterwards in
+        self.last_stream_count.
+        """
+        titles = {
+            'oscam': 'OSCam Server Configuration',
+            'cccam': 'CCcam Configuration',
+            'newcamd': 'NewCamd Configuration'
+        }
+        fmt = output_format.lower()
+        title = titles.get(fmt)
+        if title is None:
+            self.last_stream_count = 0
+            return
+
+        yield f"# {title}\n# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+
+        count = 0
+        if fmt == 'oscam':
+            for line in lines:
+                if (server := self.parse_server_line(line)) is None:
+                    continue
+                count += 1
+                label = f"{server.protocol}_{server.username}_{count}"
+                yield self._format_oscam(server, label)
+        elif fmt == 'cccam':
+            for line in lines:
+                if (server := self.parse_server_line(line)) is None:
+                    continue
+                count += 1
+                if server.protocol in _CCCAM_COMPATIBLE:
+                    yield f"C: {server.hostname} {server.port} {server.username} {server.password}\n"
+        else:
+            for line in lines:
+                if (server := self.parse_server_line(line)) is None:
+                    continue
+                count += 1
+                if server.protocol in _CCCAM_COMPATIBLE:
+                    yield self._format_newcamd(server)
+        self.last_stream_count = count
+
+    def write_oscam(self, servers, fout):
+        """Write OSCam reader blocks for an iterable of servers to a
+        binary-mode file, skipping the joined-string intermediate.
+
+        Returns the number of servers written.
+        """
+        fout.write((f"# OSCam Server Configuration\n"
+                    f"# Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n").encode('utf-8'))
+
+        count = 0
+        for server in servers:
+            count += 1
+            label = f"{server.protocol}_{server.username}_{count}"
+            fout.write(self._format_oscam(server, label).encode('utf-8'))
+        self.last_stream_count = count
+        return count